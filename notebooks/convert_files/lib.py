@@ -1,15 +1,21 @@
 import re
 import os
+import importlib.util
 
 import pandas as pd
 
 import tkinter as tk
 from tkinter import filedialog
 
+# df.to_parquet needs one of these engines; neither is a project dependency
+HAS_PARQUET = any(importlib.util.find_spec(m) is not None for m in ('pyarrow', 'fastparquet'))
+
 class FileDriver:
     def __init__(self):
         self.driver_load = {'sav': self._load_sav}
         self.driver_save = {'csv': self._save_csv}
+        if HAS_PARQUET:
+            self.driver_save['parquet'] = self._save_parquet
     #
     def _get_extension(self, pfname, default=None):
         _, ext = os.path.splitext(pfname)
@@ -17,13 +23,13 @@ class FileDriver:
         ext = ext[1:].lower() if len(ext)>1 else default
         return ext
     #
-    def _load_sav(self, pfname):
-        data = pd.read_spss(pfname)
+    def _load_sav(self, pfname, usecols=None):
+        data = pd.read_spss(pfname, usecols=usecols)
         return data
     #
-    def load(self, pfname):
+    def load(self, pfname, usecols=None):
         if ext:=self._get_extension(pfname):
-            data = self.driver_load[ext](pfname)
+            data = self.driver_load[ext](pfname, usecols=usecols)
             return data
         else:
             raise TypeError(f"File with no extension")
@@ -31,19 +37,22 @@ class FileDriver:
     def _save_csv(self, df, pfname):
         df.to_csv(pfname)
     #
+    def _save_parquet(self, df, pfname):
+        df.to_parquet(pfname, compression='zstd', index=False)
+    #
     def save(self, df, pfname):
-        ext = self._get_extension(pfname, default='.csv')
+        ext = self._get_extension(pfname, default='csv')
         try:
-            func = self.driver_save.get(ext)
+            func = self.driver_save[ext]
             func(df, pfname)
             print('Data saved')
         except KeyError:
-            "No driver for the given extensiton"
+            print(f"No driver for the given extension: {ext}")
 #
 #
 class Dialogs:
     def __init__(self):
-        self.exts = ['csv']
+        self.exts = ['csv', 'parquet'] if HAS_PARQUET else ['csv']
     #
     def load(self):
         window = tk.Tk()
@@ -67,6 +76,7 @@ class Dialogs:
         defaultextension=".csv",
         filetypes=[
             ("CSV file", "*.csv"),
+            *([("Parquet file", "*.parquet")] if HAS_PARQUET else []),
             ]
         )
         #
@@ -75,6 +85,6 @@ class Dialogs:
     #
     def _test_extension(self, pfname):
         pfname, ext = os.path.splitext(pfname)
-        ext = ext[1:] if ext in self.exts else 'csv'
+        ext = ext[1:] if ext[1:] in self.exts else 'csv'
         #
         return pfname, ext
@@ -1,22 +1,111 @@
 
+import os
 import re
-import pandas as pd
+import csv
+import hashlib
+from collections import OrderedDict
 from pathlib import Path
 import pypandoc, json
 
+try:
+    # optional Rust-backed JSON codec, several times faster than json
+    import orjson
+except ImportError:
+    orjson = None
 
+
+_PANDOC_MEMO_SIZE = 4
+_PANDOC_MEMO: OrderedDict[str, str] = OrderedDict()
+
+
+def _pandoc_convert(text, to, format, cache_dir):
+    """
+    Run a pandoc conversion, memoized by content hash.
+
+    Parameters
+    ----------
+    text : str
+        Source document.
+    to : str
+        Pandoc output format.
+    format : str
+        Pandoc input format.
+    cache_dir : pathlib.Path
+        Directory holding ``<sha1>.<to>`` conversion results.
+
+    Returns
+    -------
+    str
+        Converted document as emitted by pandoc.
+
+    Notes
+    -----
+    The hash covers both formats and the text. Results are kept in memory
+    under their hash (LRU, ``_PANDOC_MEMO_SIZE`` entries, so source texts
+    are never retained) and on disk, so re-running on an unchanged bibfile
+    skips pandoc entirely, in both directions. The disk cache is optional:
+    if ``cache_dir`` cannot be created, read or written, the conversion
+    runs uncached. Delete ``cache_dir`` after upgrading pandoc.
+    """
+    digest = hashlib.sha1(f'{format}>{to}\n{text}'.encode('utf-8')).hexdigest()
+    converted = _PANDOC_MEMO.get(digest)
+    if converted is not None:
+        _PANDOC_MEMO.move_to_end(digest)
+        return converted
+    #
+    cached = cache_dir / f'{digest}.{to}'
+    try:
+        converted = cached.read_text(encoding='utf-8')
+    except OSError:
+        converted = (
+            pypandoc
+                .convert_text(
+                    text,
+                    to,
+                    format=format,
+                    verify_format=False
+                 )
+         )
+        tmp = cached.with_name(f'{cached.name}.tmp')
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(converted, encoding='utf-8')
+            os.replace(tmp, cached)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+    #
+    _PANDOC_MEMO[digest] = converted
+    while len(_PANDOC_MEMO) > _PANDOC_MEMO_SIZE:
+        _PANDOC_MEMO.popitem(last=False)
+    return converted
+#
+#
 class BiblatexChecker:
     """
     Clean and convert BibLaTeX files to JSON and back, extracting abstracts.
 
+    Parameters
+    ----------
+    path : str or pathlib.Path, optional
+        Directory where input and output files are stored. By default
+        ``data`` under the current working directory.
+
     Attributes
     ----------
     replace_bibkeys : dict
         Mapping of special characters to ASCII equivalents for bib keys.
     replace_seq : tuple of tuple
-        Substitutions to apply after reconverting to BibLaTeX.
+        Substitutions to apply after reconverting to BibLaTeX. Applied in a
+        single pass through a compiled alternation (``_SEQ_RE``).
     path : pathlib.Path
-        Directory where input and output files are stored.
+        Directory where input and output files are stored. Cached pandoc
+        conversions live in its ``.cache`` subfolder.
+
+    Notes
+    -----
+    Pandoc formats are fixed, so ``pypandoc`` format verification is
+    disabled: it spawns ``pandoc --list-input-formats`` and
+    ``--list-output-formats`` on every conversion.
     """
     #
     replace_bibkeys = {
@@ -25,14 +114,19 @@ class BiblatexChecker:
         'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
         'ü': 'U', 'Ü': 'U', 'ć': 'c', '_': ''
      }
+    _BIBKEY_TRANS = str.maketrans(replace_bibkeys)
+    _BIBKEY_RE = re.compile(r'@(\w+)\{([\w-]+)')
     #
     replace_seq = (
         (r'\&amp', r'\&'),
         (r'~', ''),
         (r'‐', '-'),
      )
-    def __init__(self):
-        self.path = Path.cwd() / 'data'
+    _SEQ_MAP = dict(replace_seq)
+    # longest key first, so overlapping literals resolve leftmost-longest
+    _SEQ_RE = re.compile('|'.join(map(re.escape, sorted(_SEQ_MAP, key=len, reverse=True))))
+    def __init__(self, path=None):
+        self.path = Path(path) if path is not None else Path.cwd() / 'data'
     
     def load_bibfile(self, fname):
         fname = self.path / fname
@@ -58,30 +152,34 @@ class BiblatexChecker:
         -------
         str
             Content with normalized entry keys.
+
+        Notes
+        -----
+        Only the key spans are translated; the text between them is copied
+        as slices, so no Python callback runs per match. The pattern and the
+        translation table are compiled once at class creation.
         """
-        replacements = str.maketrans(BiblatexChecker.replace_bibkeys)
-        text = re.sub(
-            r'@(\w+)\{([\w-]+)',
-            lambda m: f'@{m.group(1)}{{{m.group(2).translate(replacements)}',
-            text
-         )
+        replacements = BiblatexChecker._BIBKEY_TRANS
+        parts = []
+        last = 0
+        for m in BiblatexChecker._BIBKEY_RE.finditer(text):
+            start, end = m.span(2)
+            parts.append(text[last:start])
+            parts.append(text[start:end].translate(replacements))
+            last = end
+        parts.append(text[last:])
         #
-        return text
+        return ''.join(parts)
     
     def _text_to_json(self, text):
-        raw_json = (
-            pypandoc
-                .convert_text(
-                    text,
-                    'csljson',
-                    format='biblatex'
-                 )
-         )
+        raw_json = _pandoc_convert(text, 'csljson', 'biblatex', self.path / '.cache')
+        if orjson is not None:
+            return orjson.loads(raw_json)
         return json.loads(raw_json)
     
     def _scan_authors_and_abstracts(self, entries):
         """
-        Normalize author lists and extract abstracts into a DataFrame.
+        Normalize author lists and extract abstracts into row dicts.
 
         Parameters
         ----------
@@ -91,15 +189,22 @@ class BiblatexChecker:
         Returns
         -------
         tuple
-            - entries (list of dict): Entries with de-duplicated authors.
-            - abstracts (pandas.DataFrame): Columns ['doi', 'abstract', 'bibkey', 'firsr author'].
+            - entries (list of dict): Entries with de-duplicated authors
+              (compared by family, given and literal name parts).
+            - abstracts (list of dict): Keys ['doi', 'abstract', 'bibkey', 'fst author'].
         """
         abstracts = []
         for a in entries:
             authors = a.get('author', [{'family':'', 'given': ''}])
             if len(authors)>1:
-                tmp = {(i['family'], i['given']): '' for i in a['author']}
-                authors = [{'family': i[0], 'given': i[1]} for i in tmp.keys()]
+                seen = set()
+                unique = []
+                for i in authors:
+                    key = (i.get('family', ''), i.get('given', ''), i.get('literal', ''))
+                    if key not in seen:
+                        seen.add(key)
+                        unique.append(i)
+                authors = unique
             #
             a['author'] = authors
             #
@@ -110,7 +215,6 @@ class BiblatexChecker:
                  'fst author': ', '.join(a.get('author')[0].values())
                  }
             )
-        abstracts = pd.DataFrame(abstracts)
         
         return entries, abstracts
     
@@ -122,25 +226,35 @@ class BiblatexChecker:
         ----------
         entries : list of dict
             CSL JSON entries to convert back.
-        abstracts : pandas.DataFrame
-            DataFrame of extracted abstracts.
+        abstracts : list of dict
+            Extracted abstracts, one row per entry.
+
+        Notes
+        -----
+        ``abstracts.csv`` is streamed row by row through ``csv.writer`` with
+        a 1 MiB buffer, so the whole table is never formatted in memory.
         """
-        json_data = json.dumps(entries, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            json_data = orjson.dumps(entries, option=orjson.OPT_INDENT_2).decode('utf-8')
+        else:
+            json_data = json.dumps(entries, ensure_ascii=False, indent=2)
         
-        biblatex = pypandoc.convert_text(
-            source=json_data,
-            format='csljson',
-            to='biblatex'
-         )
-        for rep in BiblatexChecker.replace_seq:
-            biblatex = biblatex.replace(*rep)
+        biblatex = _pandoc_convert(json_data, 'biblatex', 'csljson', self.path / '.cache')
+        seq_map = BiblatexChecker._SEQ_MAP
+        biblatex = BiblatexChecker._SEQ_RE.sub(lambda m: seq_map[m.group(0)], biblatex)
         
         (self.path/"output.bib").write_text(biblatex, encoding="utf-8")
         
-        abstracts.to_csv(self.path/"abstracts.csv", index=False)
+        columns = ('doi', 'abstract', 'bibkey', 'fst author')
+        with open(self.path/"abstracts.csv", 'w', newline='', encoding='utf-8', buffering=1<<20) as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(columns)
+            writer.writerows([r[c] for c in columns] for r in abstracts)
     
     def clean_entries(self, fname):
         text = self.load_bibfile(fname)
+        if text is None:
+            return
         text = self.clean_bibkeys(text)
         json_entries = self._text_to_json(text)
         json_entries, abstracts = self._scan_authors_and_abstracts(json_entries)
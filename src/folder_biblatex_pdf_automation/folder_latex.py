@@ -1,6 +1,7 @@
 from typing import Literal
 
 import os
+import re
 import shutil
 import unicodedata
 import requests
@@ -12,6 +13,7 @@ from pathlib import Path
 import pyperclip
 import bibtexparser
 from bibtexparser.bibdatabase import BibDatabase
+from bibtexparser.bwriter import BibTexWriter
 
 
 class DOI2BibManager:
@@ -22,7 +24,41 @@ class DOI2BibManager:
         (r'–', '-'),
         (r'_', r'\_')
      )
+    _LATEX_MAP = dict((*latex_chars, ("4â€“", '-')))
+    # longest key first, so overlapping literals resolve leftmost-longest
+    _LATEX_RE = re.compile('|'.join(map(re.escape, sorted(_LATEX_MAP, key=len, reverse=True))))
+    _SKIP = frozenset({'ID', 'year'})
     
+    def __init__(self):
+        """
+        Initialize DOI2BibManager with a reusable BibTeX database and writer.
+        """
+        self._db = BibDatabase()
+        self._db.comments = []
+        self._db.preambles = []
+        self._db.strings = {}
+        self._writer = BibTexWriter()
+    
+    @staticmethod
+    def _nfc(text: str) -> str:
+        """
+        NFC-normalize text, skipping the transform when it is a no-op.
+
+        Parameters
+        ----------
+        text : str
+            Input text.
+
+        Returns
+        -------
+        str
+            NFC-normalized text; the same object when ``text`` is ASCII or
+            already in NFC.
+        """
+        if text.isascii() or unicodedata.is_normalized('NFC', text):
+            return text
+        return unicodedata.normalize('NFC', text)
+
     def clean_encoding(self, text: str) -> str:
         """
         Normalize text encoding to NFC and remove non-UTF-8 characters.
@@ -36,10 +72,15 @@ class DOI2BibManager:
         -------
         str
             Cleaned text with normalized encoding.
+
+        Notes
+        -----
+        ASCII input (the usual doi.org response) is returned unchanged.
         """
+        if text.isascii():
+            return text
         text = (
-            unicodedata
-                .normalize('NFC', text)
+            self._nfc(text)
                 .encode('utf-8', 'ignore')
                 .decode('utf-8')
          )
@@ -80,12 +121,19 @@ class DOI2BibManager:
         -------
         dict
             BibLaTeX entry with cleaned fields. 
+
+        Notes
+        -----
+        All substitutions, including the ``4â€“`` mojibake fix, are applied
+        in a single pass through the compiled alternation ``_LATEX_RE``.
         """
-        for k in [k for k in bib_entry.keys() if k not in ['ID', 'year']]:
-            tmp = unicodedata.normalize('NFC', bib_entry[k])
-            for old, new in self.latex_chars:
-                tmp = tmp.replace(old, new).replace("4â€“", '-')
-            bib_entry[k] = tmp
+        latex_map = DOI2BibManager._LATEX_MAP
+        sub = DOI2BibManager._LATEX_RE.sub
+        skip = DOI2BibManager._SKIP
+        for k, v in bib_entry.items():
+            if k in skip:
+                continue
+            bib_entry[k] = sub(lambda m: latex_map[m.group(0)], self._nfc(v))
         
         return bib_entry
     
@@ -126,13 +174,14 @@ class DOI2BibManager:
         -------
         str
             BibTeX entry as a formatted string.
+
+        Notes
+        -----
+        The database and writer built in ``__init__`` are reused; only the
+        entry list is swapped on each call.
         """
-        db = BibDatabase()
-        db.entries = [bib_entry]
-        db.comments = []
-        db.preambles = []
-        db.strings = {}
-        return bibtexparser.dumps(db)
+        self._db.entries = [bib_entry]
+        return self._writer.write(self._db)
         
     def fetch(self, text: str, format: Literal['bib', 'dict']) -> tuple[str, str | dict]:
         """
@@ -186,8 +235,8 @@ class DOI2BibManager:
         str
             Extracted DOI."""
         doi = doi.strip()
-        if doi.startswith("http://") or doi.startswith("https://"):
-            return doi.split("doi.org/")[-1]
+        if doi.startswith(("http://", "https://")):
+            return doi.rpartition("doi.org/")[2]
         else:
             return doi
 
@@ -261,11 +310,22 @@ class PDFFileManager:
         -------
         FileNotFoundError
             If no PDF files are found in the origin directory.
+
+        Notes
+        -----
+        Entries are streamed from ``os.scandir``, whose ``DirEntry`` caches
+        file type (and on Windows ``stat``) from the directory read, keeping
+        only the running maximum.
         """
-        pdfs = [p for p in self.pth_org.iterdir() if p.is_file() and p.suffix.lower() == ".pdf"]
-        if len(pdfs) == 0:
+        with os.scandir(self.pth_org) as it:
+            newest = max(
+                (e for e in it if e.is_file() and e.name.lower().endswith(".pdf")),
+                key=lambda e: e.stat().st_mtime,
+                default=None
+             )
+        if newest is None:
             raise FileNotFoundError(f"No PDF files found in: {self.pth_org}")
-        return max(pdfs, key=lambda p: p.stat().st_mtime)
+        return Path(newest.path)
     
     def move_file(self, fname: Path):
         """
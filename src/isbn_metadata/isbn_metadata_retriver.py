@@ -1,7 +1,13 @@
-import urllib.request
 import json
+import time
+import sqlite3
+import requests
 import pandas as pd
+from contextlib import closing
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 class ISBNChecker:
     """
@@ -11,11 +17,21 @@ class ISBNChecker:
     ----------
     isbn_list : int, str, or list of (int or str)
         A single ISBN (int or str), or a list of ISBNs to query.
+    max_workers : int, optional
+        Number of concurrent API requests issued by ``search``.
+        By default ``MAX_WORKERS``.
+    cache : str or pathlib.Path, optional
+        SQLite file used to memoize found books by normalized ISBN. Only
+        cache misses reach the API. By default ``None`` (no cache).
 
     Attributes
     ----------
     isbns : list of str or int
         Normalized internal list of ISBNs for processing.
+    session : requests.Session
+        HTTP session shared by all requests, so TCP/TLS connections are
+        pooled and reused. Transient failures (429, 5xx) are retried with
+        exponential backoff.
 
     Examples
     --------
@@ -25,13 +41,85 @@ class ISBNChecker:
     """
     #
     URL_BASE = "https://www.googleapis.com/books/v1/volumes?q=isbn:"
-    def __init__(self, isbn_list):
+    MAX_WORKERS = 16
+    TIMEOUT = 10.0
+    NOT_FOUND = 'Book not found'
+    def __init__(self, isbn_list, max_workers=MAX_WORKERS, cache=None):
         if isinstance(isbn_list, list):
             self.isbns = isbn_list
         elif isinstance(isbn_list, (int, str)):
             self.isbns = [isbn_list]
         else:
             raise TypeError("Object isbn_list must be int|str|list")
+        #
+        self.max_workers = max_workers
+        self.cache = cache
+        self.session = self._build_session()
+    #
+    def _build_session(self):
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504)
+         )
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        return session
+    #
+    def _cache_connect(self):
+        con = sqlite3.connect(self.cache)
+        con.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(isbn TEXT PRIMARY KEY, json TEXT, fetched_at REAL)"
+         )
+        return con
+    #
+    def _cache_load(self, keys):
+        """
+        Return cached books for the given normalized ISBNs.
+
+        Parameters
+        ----------
+        keys : list of str
+            Normalized ISBNs.
+
+        Returns
+        -------
+        dict
+            ``{isbn: book}`` for the ISBNs present in the cache.
+        """
+        if self.cache is None:
+            return {}
+        #
+        books = {}
+        with closing(self._cache_connect()) as con:
+            for key in keys:
+                row = con.execute("SELECT json FROM cache WHERE isbn=?", (key,)).fetchone()
+                if row is not None:
+                    books[key] = json.loads(row[0])
+        return books
+    #
+    def _cache_store(self, books):
+        """
+        Persist newly fetched books; "not found" results are not cached so
+        they are retried on the next run.
+
+        Parameters
+        ----------
+        books : dict
+            ``{isbn: book}`` as returned by ``get_info``.
+        """
+        if self.cache is None:
+            return
+        #
+        now = time.time()
+        rows = [
+            (key, json.dumps(book, ensure_ascii=False), now)
+            for key, book in books.items() if book['title'] != ISBNChecker.NOT_FOUND
+         ]
+        with closing(self._cache_connect()) as con, con:
+            con.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", rows)
     #
     def __strip(self, isbn):
         if isinstance(isbn, int):
@@ -63,15 +151,14 @@ class ISBNChecker:
 
         Notes
         -----
-        This method performs a blocking HTTP request via urllib. No rate limiting or
-        retries are implemented.
+        This method performs a blocking HTTP request through ``session``;
+        transient errors are retried, no rate limiting is implemented.
+        It is safe to call from several threads.
         """
         #
-        with urllib.request.urlopen(f"{ISBNChecker.URL_BASE}{isbn}") as f:
-            text = f.read()
-        #
-        text = text.decode("utf-8")
-        parser = json.loads(text)
+        response = self.session.get(f"{ISBNChecker.URL_BASE}{isbn}", timeout=ISBNChecker.TIMEOUT)
+        response.raise_for_status()
+        parser = response.json()
         #
         book = {}
         if parser['totalItems']>0:
@@ -80,7 +167,7 @@ class ISBNChecker:
             book['authors'] = ', '.join(item.get('authors', ["null"]))
             book['ISBN'] = item['industryIdentifiers'][0]['identifier']
         else:
-            book = {'ISBN': isbn, 'title': 'Book not found'}
+            book = {'ISBN': isbn, 'title': ISBNChecker.NOT_FOUND}
             print("ISBN not found")
         #
         return book
@@ -98,13 +185,34 @@ class ISBNChecker:
         See Also
         --------
         ISBNDataBaseDriver.save : To persist the results as CSV.
+
+        Notes
+        -----
+        ISBNs found in ``cache`` are served locally. The remaining lookups are
+        I/O-bound, so they are de-duplicated and fanned out over a thread pool
+        of ``max_workers`` threads; results keep the input order. A lookup
+        that still fails after the session's retries (HTTP error, malformed
+        JSON) is reported and recorded as not found; it does not abort the
+        batch, and it is not cached.
         """
-        book_list = []
-        for isbn in self.isbns:
-            isbn = self.__strip(isbn)
-            book = self.get_info(isbn)
-            book_list.append(book)
+        isbns = [self.__strip(isbn) for isbn in self.isbns]
+        keys = [str(isbn) for isbn in isbns]
+        books = self._cache_load(keys)
+        #
+        missing = {key: isbn for key, isbn in zip(keys, isbns) if key not in books}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {key: executor.submit(self.get_info, isbn) for key, isbn in missing.items()}
+        fetched = {}
+        for key, future in futures.items():
+            try:
+                fetched[key] = future.result()
+            except Exception as e:
+                print(f"Error: lookup failed for ISBN {missing[key]}: {e}")
+                fetched[key] = {'ISBN': missing[key], 'title': ISBNChecker.NOT_FOUND}
+        self._cache_store(fetched)
+        books.update(fetched)
         #
+        book_list = [books[key] for key in keys]
         book_list = pd.DataFrame(book_list)
         return book_list
 #
@@ -162,7 +270,8 @@ def main():
     Main routine.
 
     1. Loads ISBNs from 'libros.csv' in the data directory.
-    2. Queries metadata from Google Books.
+    2. Queries metadata from Google Books, reusing results cached in
+       'isbn_cache.sqlite'.
     3. Saves results to 'output.csv'.
 
     Run
@@ -172,7 +281,7 @@ def main():
     isbn_db = ISBNDataBaseDriver('libros.csv')
     isbn_list = isbn_db.db['ISBN'].to_list()
     #
-    isbn_search = ISBNChecker(isbn_list)
+    isbn_search = ISBNChecker(isbn_list, cache=isbn_db.path / 'isbn_cache.sqlite')
     books = isbn_search.search()
     isbn_db.save(books)
     print(3*'\n', "Data saved...")
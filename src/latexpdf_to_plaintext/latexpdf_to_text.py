@@ -1,7 +1,21 @@
 import re
 import clipboard
 
+
+# '.\n' ends a paragraph (doubled); any other lone '\n' is a soft wrap.
+_BREAKS_RE = re.compile(r'(?P<par>\.\n)|(?<!\n)\n(?!\n)')
+_ENUM_RE = re.compile(r'^(\d{1,2}\. )', flags=re.MULTILINE)
+
+
+def _breaks(m):
+    return '.\n\n' if m.lastgroup == 'par' else ' '
+
+
 class LatexPDFtoPlainText:
+    def __init__(self):
+        # last text copied back, i.e. what the clipboard holds until the user copies again
+        self._last_out = None
+    #
     def run(self):
         r = ''
         while r.lower()!='x':
@@ -10,11 +24,14 @@ class LatexPDFtoPlainText:
     #
     def _process(self):
         text = clipboard.paste()
-        resultado = re.sub(r'\.\n', '.\n\n', text)
-        resultado = re.sub(r'(?<!\n)\n(?!\n)', ' ', resultado)
-        resultado = re.sub(r'^(\d{1,2}\. )', r'\n \1', resultado, flags=re.MULTILINE)
+        if text == self._last_out:
+            print("Clipboard unchanged, nothing to process")
+            return
+        resultado = _BREAKS_RE.sub(_breaks, text)
+        resultado = _ENUM_RE.sub(r'\n \1', resultado)
         resultado = resultado.replace('- ', '')
         clipboard.copy(resultado)
+        self._last_out = resultado
         #
         print("Processed text copied to clipboard")
 
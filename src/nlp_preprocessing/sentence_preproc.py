@@ -1,6 +1,35 @@
+import functools
+import itertools
 import spacy
+from spacy.attrs import IS_ALPHA, LOWER, LEMMA
+from spacy.pipeline import Sentencizer
 from utils import LoadYaml
 
+
+@functools.lru_cache(maxsize=None)
+def _load_model(model_name: str):
+    """
+    Load a spaCy pipeline without parser and NER, once per process.
+
+    Parameters
+    ----------
+    model_name : str
+        Installed spaCy pipeline name.
+
+    Returns
+    -------
+    spacy.language.Language
+        Pipeline shared by every ``SentencePreproc`` built with this model.
+
+    Notes
+    -----
+    Model deserialization dominates construction time; caching lets
+    notebooks, tests and repeated instantiations reuse the loaded pipeline.
+    The YAML config is already memoized by ``utils.LoadYaml``.
+    """
+    return spacy.load(model_name, exclude=["parser", "ner"])
+
+
 class SentencePreproc:
     """
     Sentence-level Spanish preprocessing pipeline.
@@ -12,16 +41,55 @@ class SentencePreproc:
 
     Parameters
     ----------
-    None
+    model_name : str, optional
+        spaCy Spanish pipeline to load. By default ``MODEL_NAME``.
+    batch_size : int, optional
+        Number of texts buffered per ``nlp.pipe`` call in ``run_batch``.
+        By default ``BATCH_SIZE``.
+    n_process : int, optional
+        Worker processes used by ``run_batch``. By default ``N_PROC``.
+
+    Raises
+    ------
+    ValueError
+        If no enabled component of the loaded pipeline assigns
+        ``token.lemma`` (e.g. ``lemmatizer`` or ``trainable_lemmatizer``,
+        whatever their instance names).
 
     Attributes
     ----------
+    MODEL_NAME : str
+        Default spaCy pipeline, ``es_core_news_sm``. Word vectors are never
+        read, so the small model avoids loading the ~500MB vector table of
+        ``es_core_news_lg``; ``EXTRA_LEMMAS`` absorbs most of its lemmatizer
+        gap on domain verbs.
+    BATCH_SIZE : int
+        Default batch size passed to ``nlp.pipe``. 50-100 suits short
+        sentences; avoid going below 32, where tagging of borderline tokens
+        may vary with batch composition.
+    N_PROC : int
+        Default number of processes for ``nlp.pipe``. For long corpora on a
+        CPU model, ``os.cpu_count() - 1`` is a good starting point.
+    RUN_CACHE_SIZE : int
+        Number of distinct texts whose ``run`` result is memoized per
+        instance.
     nlp_pipeline : spacy.language.Language
-        Loaded spaCy Spanish pipeline (``es_core_news_lg``).
-    STOPWORDS : set[str]
+        Loaded spaCy Spanish pipeline with the parser and NER excluded, so
+        their weights are never loaded; only POS tags and lemmas are
+        consumed. ``attribute_ruler`` is kept because the rule-based
+        lemmatizer depends on the POS it assigns. Shared between instances
+        with the same model (see ``_load_model``).
+    STOPWORDS : frozenset[str]
         Combined stopword set: spaCy defaults Union YAML stopwords, minus ``"no"``.
     EXTRA_LEMMAS : dict[str, str]
         Lowercased surface-form --> canonical-lemma overrides from YAML.
+        Mirrored in ``_EXTRA_LEMMA_IDS``, keyed by the surface form's vocab
+        hash (the token's ``LOWER`` attribute).
+    DROP, KEEP, OVERRIDE : int
+        Per-word actions cached in ``_token_action``: drop as stopword, keep
+        the spaCy lemma, or keep the ``EXTRA_LEMMAS`` override. The cache is
+        pre-seeded with ``DROP`` for the hash of every stopword and with
+        ``OVERRIDE`` for every other override form.
 
     Examples
     --------
@@ -29,11 +97,38 @@ class SentencePreproc:
     >>> nlp.run("Los bebés no deben tomar agua al nacer.")
     ['bebé', 'no', 'deber', 'tomar', 'agua', 'nacer']
     """
-    def __init__(self) -> None:
+    MODEL_NAME = "es_core_news_sm"
+    BATCH_SIZE = 64
+    N_PROC = 1
+    RUN_CACHE_SIZE = 100_000
+    DROP, KEEP, OVERRIDE = 0, 1, 2
+
+    def __init__(self, model_name: str = MODEL_NAME, batch_size: int = BATCH_SIZE, n_process: int = N_PROC) -> None:
+        self.BATCH_SIZE = batch_size
+        self.N_PROC = n_process
         config = LoadYaml()
-        self.nlp_pipeline = spacy.load("es_core_news_lg")
+        self.nlp_pipeline = _load_model(model_name)
+        nlp = self.nlp_pipeline
+        if not any("token.lemma" in nlp.get_pipe_meta(name).assigns for name in nlp.pipe_names):
+            raise ValueError(f"spaCy pipeline '{model_name}' has no enabled component assigning lemmas.")
         self.STOPWORDS = self._set_extra_stopwords(config)
         self.EXTRA_LEMMAS = self._set_extra_lemmas(config)
+        strings = self.nlp_pipeline.vocab.strings
+        self._EXTRA_LEMMA_IDS = {strings.add(k): v for k, v in self.EXTRA_LEMMAS.items()}
+        self._token_action: dict[int, int] = dict.fromkeys(
+            (strings[w] for w in self.STOPWORDS), self.DROP
+        )
+        for lower in self._EXTRA_LEMMA_IDS:
+            self._token_action.setdefault(lower, self.OVERRIDE)
+        self._run_cached = functools.lru_cache(maxsize=self.RUN_CACHE_SIZE)(self._run_uncached)
+        # trained senter ships disabled in the spaCy packages; rule-based fallback otherwise.
+        # None when the pipeline already runs senter itself.
+        if "senter" in nlp.pipe_names:
+            self._senter = None
+        elif "senter" in nlp.component_names:
+            self._senter = nlp.get_pipe("senter")
+        else:
+            self._senter = Sentencizer()
 
     def _set_extra_stopwords(self, config):
         """
@@ -46,7 +141,7 @@ class SentencePreproc:
 
         Returns
         -------
-        set[str]
+        frozenset[str]
             Merged stopword set where the token ``"no"`` is explicitly retained.
 
         Notes
@@ -54,9 +149,9 @@ class SentencePreproc:
         Retaining ``"no"`` helps preserve the semantic polarity of sentences in
         downstream tasks (e.g., assertion/negation detection).
         """
-        stopwords = set(self.nlp_pipeline.Defaults.stop_words) | {w.lower() for w in config.stopwords}
-        stopwords.discard("no")
-        return stopwords
+        defaults = self.nlp_pipeline.Defaults.stop_words
+        extra = (w.lower() for w in config.stopwords)
+        return frozenset(w for w in itertools.chain(defaults, extra) if w != "no")
     
     def _set_extra_lemmas(self, config):
         """
@@ -73,37 +168,172 @@ class SentencePreproc:
         dict[str, str]
             Lowercased surface form --> canonical lemma mapping.
         """
-        return {j: k for k, i in config.lemmas.items() for j in i}
+        return {j.lower(): k for k, i in config.lemmas.items() for j in i}
+
+    def _resolve_token_action(self, lower, lw):
+        """
+        Classify a token's lowercase form and cache the decision.
+
+        Parameters
+        ----------
+        lower : int
+            spaCy hash of the lowercase form (``LOWER`` attribute), not seen
+            yet.
+        lw : str
+            The lowercase form itself.
+
+        Returns
+        -------
+        int
+            ``DROP`` for stopwords, ``OVERRIDE`` for forms listed in
+            ``EXTRA_LEMMAS``, ``KEEP`` otherwise.
+        """
+        if lw in self.STOPWORDS:
+            action = self.DROP
+        elif lower in self._EXTRA_LEMMA_IDS:
+            action = self.OVERRIDE
+        else:
+            action = self.KEEP
+        self._token_action[lower] = action
+        return action
 
-    def _extra_lemmas(self, tok):
+    def _postprocess(self, doc):
         """
-        Apply custom lemma overrides and sensible defaults.
+        Filter and lemmatize the tokens of an already processed document.
 
         Parameters
         ----------
-        tok : spacy.tokens.Token
-            Token to normalize.
+        doc : spacy.tokens.Doc
+            Document produced by ``nlp_pipeline``.
 
         Returns
         -------
-        str
-            Normalized lemma (lowercased). Prefers:
-            1) explicit override in ``EXTRA_LEMMAS``,
-            2) spaCy lemma for verbs/auxiliaries,
-            3) spaCy lemma for other POS,
-            4) lowercased surface form if lemma is unavailable.
+        list[str]
+            Normalized tokens, see ``run``.
 
         Notes
         -----
-        Handling verbs and auxiliaries explicitly reduces inflectional variance
-        that otherwise leaks into features.
+        This is the per-token hot loop. ``IS_ALPHA``, ``LOWER`` and ``LEMMA``
+        are exported in one ``Doc.to_array`` call, so no ``Token`` object is
+        created; strings are decoded through ``vocab.strings`` only for
+        tokens that survive. Stopword and override decisions depend only on
+        the lowercase form, so they are resolved once per word and cached
+        under its integer hash. After warm-up, a stopword costs a single int
+        dict lookup and no string decoding; unseen words are resolved inline,
+        in the same single pass over the rows.
+        Kept tokens take the ``_EXTRA_LEMMA_IDS`` override, else the
+        lowercased spaCy lemma; the lemmatizer required at construction
+        always assigns one, so there is no fallback to the surface form.
+        """
+        rows = doc.to_array([IS_ALPHA, LOWER, LEMMA]).tolist()
+        return self._postprocess_rows(rows, doc.vocab.strings)
+
+    def _postprocess_rows(self, rows, strings):
         """
-        lw = tok.text.lower()
-        if lw in self.EXTRA_LEMMAS:
-            return self.EXTRA_LEMMAS[lw]
-        if tok.pos_ in ("VERB","AUX"):
-            return tok.lemma_.lower() if tok.lemma_ else lw
-        return tok.lemma_.lower() if tok.lemma_ else lw
+        Filter and lemmatize exported token rows, see ``_postprocess``.
+
+        Parameters
+        ----------
+        rows : list[list[int]]
+            ``[IS_ALPHA, LOWER, LEMMA]`` rows from ``Doc.to_array``, possibly
+            a slice covering one sentence.
+        strings : spacy.strings.StringStore
+            String store used to decode the hashes.
+
+        Returns
+        -------
+        list[str]
+            Normalized tokens, see ``run``.
+        """
+        actions = self._token_action
+        resolve = self._resolve_token_action
+        extra_lemmas = self._EXTRA_LEMMA_IDS
+        drop, override = self.DROP, self.OVERRIDE
+        out = []
+        out_append = out.append
+        for is_alpha, lower, lemma in rows:
+            if not is_alpha:
+                continue
+            action = actions.get(lower)
+            if action is None:
+                action = resolve(lower, strings[lower])
+            if action == drop:
+                continue
+            if action == override:
+                out_append(extra_lemmas[lower])
+            else:
+                out_append(strings[lemma].lower())
+        return out
+
+    def run_batch(self, texts, batch_size: int | None = None, n_process: int | None = None):
+        """
+        Tokenize, filter, and lemmatize a stream of Spanish sentences.
+
+        Parameters
+        ----------
+        texts : iterable of str
+            Raw input texts.
+        batch_size : int, optional
+            Texts buffered per ``nlp.pipe`` batch. By default the instance's
+            ``BATCH_SIZE``.
+        n_process : int, optional
+            Worker processes used by ``nlp.pipe``; ``-1`` uses every CPU.
+            Only worth it for large corpora, since each worker loads its own
+            copy of the model. By default the instance's ``N_PROC``.
+
+        Yields
+        ------
+        list[str]
+            Normalized tokens for each input text, in input order
+            (see ``run``).
+
+        Notes
+        -----
+        Texts are fed through ``nlp.pipe`` in chunks of ``batch_size``, which
+        amortizes the statistical components over the whole batch instead of
+        paying their overhead once per sentence. With ``n_process > 1``
+        only the pipeline is sent to the workers; docs come back to this
+        process, where ``_postprocess`` and its caches run, so the instance
+        itself never needs to be pickled.
+        """
+        if batch_size is None:
+            batch_size = self.BATCH_SIZE
+        if n_process is None:
+            n_process = self.N_PROC
+        docs = self.nlp_pipeline.pipe(texts, batch_size=batch_size, n_process=n_process)
+        for doc in docs:
+            yield self._postprocess(doc)
+
+    def run_document(self, text: str):
+        """
+        Split one long text into sentences and normalize each of them.
+
+        Parameters
+        ----------
+        text : str
+            Raw document text, e.g. a full clinical note.
+
+        Returns
+        -------
+        list[list[str]]
+            Normalized tokens per sentence, in document order (see ``run``).
+
+        Notes
+        -----
+        The document goes through the pipeline once and sentences are cheap
+        ``doc.sents`` span views over it, instead of one pipeline call per
+        pre-split sentence. Boundaries come from the packaged ``senter``
+        component when the model ships one (the parser is excluded), else
+        from spaCy's punctuation-based ``Sentencizer``; no extra pass runs
+        when ``senter`` is already enabled in the pipeline. Token attributes
+        are exported once for the whole document and sliced per sentence.
+        """
+        doc = self.nlp_pipeline(text)
+        if self._senter is not None:
+            doc = self._senter(doc)
+        rows = doc.to_array([IS_ALPHA, LOWER, LEMMA]).tolist()
+        strings = doc.vocab.strings
+        return [self._postprocess_rows(rows[sent.start:sent.end], strings) for sent in doc.sents]
 
     def run(self, text: str):
         """
@@ -126,15 +356,15 @@ class SentencePreproc:
         -----
         Punctuation, numbers, and non-alphabetic tokens are skipped. To retain
         numerals or symbols for specific tasks, adjust the ``is_alpha`` filter.
+        Single-text convenience wrapper around ``run_batch``; prefer
+        ``run_batch`` when processing many texts. Results are memoized per
+        instance (LRU, ``RUN_CACHE_SIZE`` texts), so repeated sentences skip
+        spaCy entirely; a fresh list is returned on every call.
         """
-        doc = self.nlp_pipeline(text)
-        out = []
-        for tok in doc:
-            if tok.is_alpha:
-                lw = tok.text.lower()
-                if not lw in self.STOPWORDS:
-                    out.append(self._extra_lemmas(tok))
-        return out
+        return list(self._run_cached(text))
+
+    def _run_uncached(self, text: str) -> tuple[str, ...]:
+        return tuple(next(self.run_batch([text])))
 
 if __name__ == "__main__":
     """
@@ -147,4 +377,3 @@ if __name__ == "__main__":
     nlp = SentencePreproc()
     res = nlp.run(text)
     print(" ".join(res))
-    breakpoint()
@@ -5,16 +5,58 @@ This module normalizes Spanish texts using a transformer pipeline
 (``es_dep_news_trf``). It handles GPU activation, long text limits,
 accent stripping, numeric detection, and stopword filtering while
 preserving user-defined negation words from a YAML config.
+
+Loaded pipelines are shared by every ``SentencePreprocTransformer`` of the
+process (see ``_get_pipeline``). When parallelizing across processes on
+Linux, prefer the ``fork`` start method: ``spawn`` re-imports torch/spaCy
+and reloads the model in every worker, which costs several seconds each.
 """
 
 import re
+import functools
 import unicodedata
 import spacy
 from spacy.lang.es.stop_words import STOP_WORDS as SPACY_STOP_ES
+from thinc.api import set_gpu_allocator
 
 from utils import LoadYaml
 
 
+@functools.lru_cache(maxsize=2)
+def _get_pipeline(model_name: str, mixed_precision: bool):
+    """
+    Load a GPU transformer pipeline once per process.
+
+    Parameters
+    ----------
+    model_name : str
+        Installed spaCy transformer pipeline name.
+    mixed_precision : bool
+        Run the transformer forward pass under FP16 autocast.
+
+    Returns
+    -------
+    spacy.language.Language
+        Pipeline with the dependency parser disabled and ``max_length``
+        raised to allow very long inputs.
+
+    Notes
+    -----
+    ``spacy.require_gpu()`` and ``spacy.load`` take seconds and hundreds of
+    MB of VRAM; caching keeps repeated instantiations (notebooks, tests) from
+    paying that again.
+    """
+    spacy.require_gpu()
+    set_gpu_allocator("pytorch")
+    nlp_pipeline = spacy.load(
+        model_name,
+        disable=["parser"],
+        config={"components.transformer.model.mixed_precision": mixed_precision}
+     )
+    nlp_pipeline.max_length = 2_000_000
+    return nlp_pipeline
+
+
 class SentencePreprocTransformer:
     """
     Transformer-backed sentence preprocessor for Spanish.
@@ -26,33 +68,74 @@ class SentencePreprocTransformer:
     4) remove Spanish stopwords (accent-insensitive),
     5) retain negation tokens configured via YAML.
 
+    Parameters
+    ----------
+    model_name : str, optional
+        spaCy transformer pipeline to load. By default ``MODEL_NAME``.
+    batch_size : int, optional
+        Batch size passed to ``nlp.pipe``. By default ``BATCH_SIZE``.
+    mixed_precision : bool, optional
+        Run the transformer forward pass under FP16 autocast. Roughly halves
+        memory traffic and uses tensor cores on recent GPUs. By default
+        ``True``.
+
     Attributes
     ----------
+    MODEL_NAME : str
+        Default spaCy pipeline, ``es_dep_news_trf``.
     BATCH_SIZE : int
-        Batch size passed to ``nlp.pipe``.
+        Batch size passed to ``nlp.pipe``. Transformer pipelines saturate the
+        GPU early, so larger values do not necessarily increase throughput;
+        tune it per hardware through the constructor.
     N_PROC : int
         Number of processes for ``nlp.pipe``. Kept at 1 due to GPU use.
+    NUM_PAT : re.Pattern
+        Compiled pattern for numeric-like token texts (see
+        ``_is_numeric_token``).
+    ACCENT_TBL : dict[int, str]
+        ``str.translate`` table mapping accented Spanish letters to their
+        unaccented base letter.
     nlp_pipeline : spacy.language.Language
-        Loaded Spanish transformer pipeline (``es_dep_news_trf``).
-    STOP_ES_NOACC : set[str]
+        Loaded Spanish transformer pipeline with the dependency parser
+        disabled; only lemmas are consumed. Shared between instances with the
+        same model and precision settings.
+    STOP_ES_NOACC : frozenset[str]
         Spanish stopwords from spaCy with accents stripped and lowercased.
-    NEG_KEEP_BASE : set[str]
+    NEG_KEEP_BASE : frozenset[str]
         Negation terms to keep (read from YAML; compared against stripped forms).
 
     Notes
     -----
     - Requires GPU support; ``spacy.require_gpu()`` is called in ``__init__``.
+    - CuPy allocations are routed through PyTorch's memory pool so Thinc and
+      the transformer share one allocator.
     - ``nlp_pipeline.max_length`` is increased to allow very long inputs.
     """
+    MODEL_NAME = "es_dep_news_trf"
     BATCH_SIZE = 64
     N_PROC = 1
-
-    def __init__(self) -> None:
+    NUM_PAT = re.compile(
+        r"""^(
+            (\d+([.,]\d+)?([eE][+-]?\d+)?)
+            (/%|%)?
+            |
+            (\d+/\d+)
+        )$""",
+        re.VERBOSE
+     )
+    ACCENT_TBL = str.maketrans("áéíóúüñÁÉÍÓÚÜÑ", "aeiouunAEIOUUN")
+
+    def __init__(
+            self,
+            model_name: str = MODEL_NAME,
+            batch_size: int = BATCH_SIZE,
+            mixed_precision: bool = True
+         ) -> None:
         """
         Initialize the transformer pipeline and preprocessing resources.
 
-        Loads the Spanish dependency/transformer model, increases the maximum
-        document length, and prepares:
+        Obtains the Spanish dependency/transformer model from the process-wide
+        cache (loading it on first use), and prepares:
         - accent-stripped stopword set,
         - domain-specific negation words loaded from YAML.
 
@@ -63,17 +146,17 @@ class SentencePreprocTransformer:
         RuntimeError
             If a GPU is not available when ``spacy.require_gpu()`` is enforced.
         """
-        spacy.require_gpu()
-        self.nlp_pipeline = spacy.load("es_dep_news_trf")
-        self.nlp_pipeline.max_length = 2_000_000
+        self.BATCH_SIZE = batch_size
+        self.nlp_pipeline = _get_pipeline(model_name, mixed_precision)
         config = LoadYaml()
 
-        self.STOP_ES_NOACC = {self._strip_accents(w.lower()) for w in SPACY_STOP_ES}
+        self.STOP_ES_NOACC = frozenset(self._strip_accents(w.lower()) for w in SPACY_STOP_ES)
         self.NEG_KEEP_BASE = self._set_negative_words(config)
+        self._norm_cache: dict[tuple[int, int], str] = {}
 
     def _strip_accents(self, s: str) -> str:
         """
-        Remove diacritical marks using Unicode NFD normalization.
+        Remove diacritical marks, with a fast path for Spanish letters.
 
         Parameters
         ----------
@@ -88,7 +171,14 @@ class SentencePreprocTransformer:
         Notes
         -----
         This is applied both to lemmas and stopwords to align comparisons.
+        Spanish accents are removed with a single ``str.translate`` pass over
+        ``ACCENT_TBL``; only strings that are still non-ASCII afterwards go
+        through the per-character NFD filter, so the result is identical to
+        stripping every combining mark (``Mn``).
         """
+        s = s.translate(self.ACCENT_TBL)
+        if s.isascii():
+            return s
         return "".join(
             ch for ch in unicodedata.normalize("NFD", s)
             if unicodedata.category(ch) != "Mn"
@@ -105,14 +195,14 @@ class SentencePreprocTransformer:
 
         Returns
         -------
-        iterable
+        frozenset[str]
             Negation tokens that should not be removed during stopword filtering.
 
         Notes
         -----
         ``NEG_KEEP_BASE`` is later compared against accent-stripped lemmas.
         """
-        return config.negative
+        return frozenset(config.negative)
 
     def _is_numeric_token(self, tok) -> bool:
         """
@@ -132,26 +222,41 @@ class SentencePreprocTransformer:
 
         Notes
         -----
-        Combines ``tok.like_num`` with a verbose regex to capture common
-        clinical numeric formats.
+        Combines ``tok.like_num`` with the class-level ``NUM_PAT`` regex,
+        compiled once, to capture common clinical numeric formats.
         """
-        pattern = re.compile(
-                r"""^(
-                    (\d+([.,]\d+)?([eE][+-]?\d+)?)
-                    (/%|%)?
-                    |
-                    (\d+/\d+)
-                )$""",
-                re.VERBOSE
-             )
-
-        txt = tok.text
-        if tok.like_num or pattern.match(txt):
-            return True
-        else:
-            return False
+        return tok.like_num or self.NUM_PAT.match(tok.text) is not None
     
     def _normalize_token(self, token) -> str:
+        """
+        Normalize a single token, memoized per (surface form, lemma) pair.
+
+        Parameters
+        ----------
+        token : spacy.tokens.Token
+            Token to normalize.
+
+        Returns
+        -------
+        str
+            Normalized token or empty string if filtered out
+            (see ``_normalize_uncached``).
+
+        Notes
+        -----
+        The result only depends on the token text, its lexical flags
+        (``like_num``, ``is_space``, ``is_punct``) and its lemma, so it is
+        cached under the spaCy string hashes ``(token.orth, token.lemma)``.
+        Repeated tokens, which dominate real corpora, then cost one dict
+        lookup. The cache grows with the number of distinct pairs seen.
+        """
+        key = (token.orth, token.lemma)
+        norm = self._norm_cache.get(key)
+        if norm is None:
+            norm = self._norm_cache[key] = self._normalize_uncached(token)
+        return norm
+
+    def _normalize_uncached(self, token) -> str:
         """
         Normalize a single token with lemmatization and filtering.
 
@@ -210,17 +315,28 @@ class SentencePreprocTransformer:
         Notes
         -----
         - Uses ``nlp.pipe`` with GPU for throughput.
-        - Collapses multiple spaces after filtering to maintain clean output.
+        - Filtered tokens are dropped before joining, so the output has
+          single spaces without a second whitespace-collapsing pass.
         - ``BATCH_SIZE`` and ``N_PROC`` control throughput; with GPU, keep
           ``N_PROC=1`` to avoid overhead.
+        - The ``_normalize_token`` cache lookup is inlined in the token loop,
+          so tokens already seen cost no Python call; only cache misses go
+          through ``_normalize_uncached``.
         """
+        cache = self._norm_cache
+        normalize = self._normalize_uncached
         out = []
         for doc in self.nlp_pipeline.pipe(texts, batch_size=self.BATCH_SIZE, n_process=self.N_PROC):
-            toks = [self._normalize_token(t) for t in doc]
-            toks = [w for w in toks if w]
-            s = " ".join(toks)
-            s = " ".join(s.split())
-            out.append(s)
+            toks = []
+            toks_append = toks.append
+            for t in doc:
+                key = (t.orth, t.lemma)
+                w = cache.get(key)
+                if w is None:
+                    w = cache[key] = normalize(t)
+                if w:
+                    toks_append(w)
+            out.append(" ".join(toks))
         return out
 
 
@@ -242,7 +358,6 @@ if __name__ == "__main__":
     model = SentencePreprocTransformer()
     for n, (org, proc) in enumerate(zip(textos, model.run(textos))):
         print(f"\n{n+1}:\n  {org}\n  {proc}")
-    breakpoint()
 
 
 
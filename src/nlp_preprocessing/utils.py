@@ -2,18 +2,154 @@
 This module provides:
 - `LoadYaml`: loads project-specific configuration (stopwords and lemmatization
   mappings) from a YAML file.
-- `SentencePreproc`: tokenization, stopword filtering (with domain-specific
-  overrides), and lemmatization with optional custom lemma mappings.
+
+`SentencePreproc` lives in ``sentence_preproc.py`` and imports `LoadYaml`
+from here.
 
 Notes
 -----
-- YAML file is expected under ``./src/nlp_preprocessing/<fname>``.
+- YAML file is expected next to this module
+  (``src/nlp_preprocessing/<fname>``), independently of the working
+  directory.
+- Parsed documents are cached per absolute path and reused while the file's
+  modification time and size are unchanged.
+- The first parse also writes a ``<fname>.json`` sidecar next to the YAML
+  file; later processes load it with ``json`` instead of re-parsing YAML
+  while the source's modification time and size match the ones recorded
+  in it.
 """
 
+import copy
+import json
+import os
+from collections import OrderedDict
+
 import yaml
-from yaml.loader import SafeLoader
 from pathlib import Path
 
+try:
+    # LibYAML C parser, roughly an order of magnitude faster
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+_CONFIG_DIR = Path(__file__).resolve().parent
+_YAML_CACHE_SIZE = 100
+_YAML_CACHE: OrderedDict[str, tuple[int, int, list]] = OrderedDict()
+
+
+def _load_docs(path):
+    """
+    Parse every document of a YAML stream, memoized per file.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Absolute path of the YAML file.
+
+    Returns
+    -------
+    list
+        Parsed YAML documents. A deep copy of the cached value is returned so
+        callers can mutate it freely.
+
+    Notes
+    -----
+    Entries are validated against ``(st_mtime_ns, st_size)`` and evicted in
+    LRU order once more than ``_YAML_CACHE_SIZE`` files are cached. On a
+    cache miss the JSON sidecar (see ``_read_sidecar``) is preferred over the
+    YAML parser, which is LibYAML's ``CSafeLoader`` when PyYAML was built
+    with it.
+    """
+    key = str(path)
+    st = os.stat(path)
+    hit = _YAML_CACHE.get(key)
+    if hit is not None and hit[:2] == (st.st_mtime_ns, st.st_size):
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(hit[2])
+
+    docs = _read_sidecar(path, st)
+    if docs is None:
+        with open(path, 'r', encoding="utf-8") as file:
+            docs = [*yaml.load_all(file, Loader=_Loader)]
+        _write_sidecar(path, st, docs)
+
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, docs)
+    _YAML_CACHE.move_to_end(key)
+    while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(docs)
+
+
+def _sidecar_path(path):
+    return path.with_name(f"{path.name}.json")
+
+
+def _read_sidecar(path, st):
+    """
+    Load the JSON sidecar of a YAML file if it was built from this version.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Path of the source YAML file.
+    st : os.stat_result
+        Current ``stat`` of the source YAML file.
+
+    Returns
+    -------
+    list or None
+        Parsed documents, or ``None`` if the sidecar is missing, unreadable,
+        or was written for a source with a different ``(st_mtime_ns,
+        st_size)``.
+
+    Notes
+    -----
+    The source's stat is recorded inside the sidecar and compared exactly,
+    as the in-memory cache does; comparing file mtimes would accept a stale
+    sidecar after ``git checkout`` or ``cp -p`` restore an older YAML file.
+    """
+    sidecar = _sidecar_path(path)
+    try:
+        with open(sidecar, 'r', encoding="utf-8") as file:
+            data = json.load(file)
+        if [data["mtime_ns"], data["size"]] != [st.st_mtime_ns, st.st_size]:
+            return None
+        return data["docs"]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _write_sidecar(path, st, docs):
+    """
+    Best-effort dump of parsed YAML documents to the JSON sidecar.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Path of the source YAML file.
+    st : os.stat_result
+        ``stat`` of the source YAML file taken before parsing it.
+    docs : list
+        Parsed YAML documents.
+
+    Notes
+    -----
+    The file is written to a temporary name and moved into place, so
+    readers never see a partial sidecar. Read-only locations and documents
+    that are not JSON-serializable are silently skipped.
+    """
+    sidecar = _sidecar_path(path)
+    tmp = sidecar.with_name(f"{sidecar.name}.tmp")
+    try:
+        with open(tmp, 'w', encoding="utf-8") as file:
+            data = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "docs": docs}
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        tmp.unlink(missing_ok=True)
+
 
 class LoadYaml:
     """
@@ -22,8 +158,8 @@ class LoadYaml:
     Parameters
     ----------
     fname : str, optional
-        File name of the YAML configuration located in
-        ``./src/NLP_Preprocessing/``. By default ``'extra.yml'``.
+        File name of the YAML configuration located in the same directory as
+        this module (``src/nlp_preprocessing/``). By default ``'extra.yml'``.
 
     Attributes
     ----------
@@ -40,8 +176,7 @@ class LoadYaml:
     enables a flexible, document-per-setting YAML layout.
     """
     def __init__(self, fname='extra.yml') -> None:
-        path = Path('.') / 'src/nlp_preprocessing' / fname
-        with open(path.absolute(), 'r', encoding="utf-8") as file:
-            docs = [*yaml.load_all(file, Loader=SafeLoader)]
-            for d in docs:
-                setattr(self, *[*d.items()][0])
+        path = _CONFIG_DIR / fname
+        for d in _load_docs(path):
+            key, value = next(iter(d.items()))
+            setattr(self, key, value)